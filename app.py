@@ -1,146 +1,224 @@
+import numpy as np
 import pandas as pd
 import streamlit as st
 import plotly.express as px
 
-def show_metrics(df, title="India"):
-    total_production = df["production"].sum()
-    total_area = df["area"].sum()
-    avg_yield = df["yield"].mean()
-    num_crops = df["crop"].nunique()
-    num_states = df["state"].nunique()
-    num_years = df["year"].nunique()
+CATEGORY_COLS = ["state", "district", "crop", "season"]
 
-    st.header(f"Key Metrics - {title}")
+# Static season reference table shown above the season analysis panel
+SEASON_TABLE_MD = """
+| Season       | Time Period                | Characteristics |
+|--------------|----------------------------|-----------------|
+| **Kharif**   | **June - October** (monsoon season) | Sown at the beginning of the rainy season, harvested at the end; require a lot of water. |
+| **Rabi**     | **November - April** (winter season) | Sown after the monsoon, harvested in spring; require cooler climate and less water. |
+| **Summer**   | **March - June** (pre-monsoon) | Grown between Rabi harvest and Kharif sowing; often need irrigation. |
+| **Whole Year** | **Any time** | Can be grown throughout the year due to suitable climate or controlled environments. |
+| **Autumn**   | **September - November** | Transitional season after Kharif harvest, before Rabi sowing; short-duration crops. |
+| **Winter**   | **December - February** | Cold-season crops; sometimes grown entirely within the coldest months. |
+"""
 
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.metric("🌾 Total Production (tons)", f"{total_production:,.0f}")
-    with col2:
-        st.metric("📏 Total Area (hectares)", f"{total_area:,.0f}")
-    with col3:
-        st.metric("⚖️ Average Yield (t/ha)", f"{avg_yield:.2f}")
 
-    col4, col5, col6 = st.columns(3)
-    with col4:
-        st.metric("🪴 Number of Crops", num_crops)
-    with col5:
-        st.metric("🗺️ States Covered", num_states)
-    with col6:
-        st.metric("📅 Years Covered", num_years)
+def _tighten_dtypes(df):
+    # Low-cardinality labels become categoricals and years int16. production (integer
+    # tonnes) and area keep their source dtypes: both are shown row-by-row, and
+    # float32 cannot hold every value exactly
+    for col in CATEGORY_COLS:
+        df[col] = df[col].astype("category")
+    df["year"] = df["year"].astype("int16")
+    return df
 
 
-# Streamlit page config
-st.set_page_config(layout='wide', page_title='Crop Production Dashboard')
-st.markdown("""
-    <style>
-        .block-container {
-            padding-top: 1rem; /* Reduce default padding */
-        }
-    </style>
-""", unsafe_allow_html=True)
+@st.cache_data
+def load_main():
+    df = _tighten_dtypes(pd.read_parquet("data/main_crops.parquet"))
+    # Main-crop yield is only ever averaged, never shown per row, so float32 is enough
+    df["yield"] = df["yield"].astype("float32")
+    return df
 
-# Title
-st.title("📊 Crop Production Statistics in India")
-st.sidebar.title("Customize Your View")
 
-# Load dataset
-df = pd.read_csv("data/main_crops.csv")
+@st.cache_data
+def load_coconut():
+    df = _tighten_dtypes(pd.read_parquet("data/coconut_filtered.parquet"))
+    # The stored yield is rounded to 2 decimals; recompute it exactly once at load time
+    area = df["area"].to_numpy()
+    prod = df["production"].to_numpy()
+    df["yield"] = np.where(area > 0, prod / np.maximum(area, 1e-9), np.nan)
+    return df
+
+
+@st.cache_data
+def load_main_by_state():
+    # Stable sort on state: each state's rows form one contiguous block in file order
+    return load_main().sort_values("state", kind="stable").set_index("state", drop=False)
+
+
+@st.cache_data
+def load_main_by_year():
+    return load_main().sort_values("year", kind="stable")
+
+
+@st.cache_data
+def load_coconut_by_state():
+    return load_coconut().sort_values(["state", "year"]).set_index("state", drop=False)
+
+
+@st.cache_data
+def load_coconut_by_state_year():
+    return load_coconut().set_index(["state", "year"], drop=False).sort_index()
+
+
+@st.cache_data
+def build_cube(df):
+    # (state, year, season, crop) summary; yield is kept as sum + row count so that
+    # means over any slice of the cube stay exact
+    return df.groupby(["state", "year", "season", "crop"], observed=True).agg(
+        production=("production", "sum"),
+        area=("area", "sum"),
+        yield_sum=("yield", "sum"),
+        rows=("yield", "size"),
+    ).sort_index()
+
+
+@st.cache_data
+def main_year_range():
+    years = load_main()["year"]
+    return int(years.min()), int(years.max())
+
+
+@st.cache_data
+def coconut_years():
+    return np.sort(load_coconut()["year"].unique()).tolist()
+
+
+@st.cache_data(max_entries=64)
+def agg_by(df, cols, val, how="sum"):
+    # Keyed on Streamlit's hash of the frame (a fixed 10k-row sample once it has 50k+
+    # rows). The season panel calls this once per year window/season, so entries are capped
+    return getattr(df.groupby(cols, observed=True)[val], how)().reset_index()
+
+
+@st.cache_data
+def agg_stats(df, cols, stats):
+    # One grouper for several named reductions, e.g. {"area": ("area", "sum")}
+    return df.groupby(cols, observed=True).agg(**stats).reset_index()
+
+
+@st.cache_data
+def corr_of(df, cols):
+    return df[cols].corr()
+
+
+@st.cache_data
+def pivot_sum(df, index, columns, val):
+    # Dense index x columns matrix of summed values, zero where a pair never occurs
+    return df.pivot_table(index=index, columns=columns, values=val, aggfunc="sum",
+                          fill_value=0, observed=True)
 
-# Sidebar selector
-state_option = st.sidebar.selectbox(
-    "Select Region",
-    options=["All India"] + sorted(df["state"].unique())
-)
 
-# ---------------- STATE LEVEL VIEW ----------------
-if state_option != "All India":
+@st.cache_data
+def yearly_reduce(df, sums=(), means=()):
+    # df must be sorted by year: each year is then one contiguous run, reduced with reduceat
+    years = df["year"].to_numpy()
+    if years.size == 0:
+        return pd.DataFrame(columns=["year", *sums, *means])
+    starts = np.r_[0, np.flatnonzero(np.diff(years)) + 1]
+    out = {"year": years[starts]}
+    for col in sums:
+        out[col] = np.add.reduceat(df[col].to_numpy(), starts, dtype=np.float64)
+    for col in means:
+        # NaN-skipping, like groupby().mean(): a year with no valid values comes out NaN
+        vals = df[col].to_numpy()
+        missing = np.isnan(vals)
+        totals = np.add.reduceat(np.where(missing, 0, vals), starts, dtype=np.float64)
+        valid = np.add.reduceat(~missing, starts, dtype=np.int64)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            out[col] = totals / valid
+    return pd.DataFrame(out)
 
-    # Filter for selected state
-    filtered_df = df[df["state"] == state_option]
-    show_metrics(filtered_df, title=state_option)
 
-    # ---- Crop-wise Production ----
-    crop_prod = filtered_df.groupby("crop")["production"].sum().reset_index()
-    fig1 = px.bar(crop_prod, x="crop", y="production", title=f"🌾 Crop-wise Production in {state_option}")
-    st.plotly_chart(fig1, use_container_width=True)
+@st.cache_data
+def india_yearly(by_year):
+    # Derived from the yearly totals already computed for the trend charts, so the
+    # raw rows are not reduced a second time; yield and YoY % change are array ops
+    g = by_year[["year", "area", "production"]].copy()
+    prod = g["production"].to_numpy()
+    g["yield"] = prod / g["area"].to_numpy()
+    g["prod_pct_change"] = np.concatenate(([np.nan], np.diff(prod) / prod[:-1] * 100))
+    return g
 
-    # ---- Yield Trend ----
-    yield_trend = filtered_df.groupby("year")["yield"].mean().reset_index()
-    fig2 = px.line(yield_trend, x="year", y="yield", markers=True,
-                   title=f"📈 Yield Trend in {state_option}")
-    st.plotly_chart(fig2, use_container_width=True)
 
-    # ---- Heatmap: Crop vs Season ----
-    heatmap_df = filtered_df.groupby(["crop", "season"])["production"].sum().reset_index()
-    fig3 = px.density_heatmap(
-        heatmap_df,
-        x="season",
-        y="crop",
-        z="production",
-        title=f"🔥 Crop vs Season Production in {state_option}",
-        color_continuous_scale="Turbo"
-    )
-    fig3.update_layout(
-        width=1000,
-        height=700,
-        xaxis_title="Season",
-        yaxis_title="Crop",
-        title_x=0.3,
-        font=dict(size=14)
-    )
-    st.plotly_chart(fig3, use_container_width=True)
+@st.cache_data
+def top_by_sum(df, key, val, n=10):
+    # Group sums over the categorical codes with bincount, then a partial sort for the top n
+    codes = df[key].cat.codes.to_numpy()
+    num_groups = len(df[key].cat.categories)
+    present = np.flatnonzero(np.bincount(codes, minlength=num_groups))
+    sums = np.bincount(codes, weights=df[val].to_numpy(), minlength=num_groups)[present]
+    top = np.argpartition(-sums, n)[:n] if sums.size > n else np.arange(sums.size)
+    top = top[np.argsort(-sums[top], kind="stable")]
+    return pd.DataFrame({key: df[key].cat.categories[present[top]], val: sums[top]})
 
-    # ---------------- SEASON ANALYSIS ----------------
-    st.subheader("🌾 Season Analysis")
 
-    # Markdown table
-    st.markdown("""
-    | Season       | Time Period                | Characteristics |
-    |--------------|----------------------------|-----------------|
-    | **Kharif**   | **June - October** (monsoon season) | Sown at the beginning of the rainy season, harvested at the end; require a lot of water. |
-    | **Rabi**     | **November - April** (winter season) | Sown after the monsoon, harvested in spring; require cooler climate and less water. |
-    | **Summer**   | **March - June** (pre-monsoon) | Grown between Rabi harvest and Kharif sowing; often need irrigation. |
-    | **Whole Year** | **Any time** | Can be grown throughout the year due to suitable climate or controlled environments. |
-    | **Autumn**   | **September - November** | Transitional season after Kharif harvest, before Rabi sowing; short-duration crops. |
-    | **Winter**   | **December - February** | Cold-season crops; sometimes grown entirely within the coldest months. |
-    """)
+def show_metrics(df, title="India"):
+    stats = df.agg({"production": "sum", "area": "sum", "yield": "mean"})
+    counts = df[["crop", "state", "year"]].nunique()
 
-    seasons = filtered_df["season"].unique()
+    st.header(f"Key Metrics - {title}")
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("🌾 Total Production (tons)", f"{stats['production']:,.0f}")
+    with col2:
+        st.metric("📏 Total Area (hectares)", f"{stats['area']:,.0f}")
+    with col3:
+        st.metric("⚖️ Average Yield (t/ha)", f"{stats['yield']:.2f}")
+
+    col4, col5, col6 = st.columns(3)
+    with col4:
+        st.metric("🪴 Number of Crops", counts["crop"])
+    with col5:
+        st.metric("🗺️ States Covered", counts["state"])
+    with col6:
+        st.metric("📅 Years Covered", counts["year"])
+
+
+@st.fragment
+def season_panel(filtered_df, state, seasons, year_min, year_max):
+    # Runs as a fragment: the season/year widgets only rerun these two charts
     selected_season = st.selectbox("Select Season:", seasons)
 
     year_range = st.slider(
         "Select Year Range:",
-        int(df["year"].min()), int(df["year"].max()),
-        (int(df["year"].min()), int(df["year"].max()))
+        year_min, year_max,
+        (year_min, year_max)
     )
 
+    # filtered_df is year-sorted, so the year range is a contiguous block of rows
+    years = filtered_df["year"].to_numpy()
+    lo = np.searchsorted(years, year_range[0], side="left")
+    hi = np.searchsorted(years, year_range[1], side="right")
+    year_filtered_df = filtered_df.iloc[lo:hi]
+
     # Apply BOTH filters (state + season + year)
-    filtered_df_season_year = filtered_df[
-        (filtered_df["season"] == selected_season) &
-        (filtered_df["year"].between(year_range[0], year_range[1]))
-    ]
+    filtered_df_season_year = year_filtered_df[year_filtered_df["season"] == selected_season]
 
     # Layout for charts
     col1, col2 = st.columns(2)
 
     with col1:
-        # Apply year filter for all seasons of the state
-        year_filtered_df = filtered_df[
-            (filtered_df["year"].between(year_range[0], year_range[1]))
-        ]
-        total_production = year_filtered_df["production"].sum()
+        # One grouped pass; the total comes from the handful of per-season sums
+        seasonal_share = agg_by(year_filtered_df, "season", "production")
+        total_production = seasonal_share["production"].sum()
 
         if total_production > 0:
-            seasonal_share = (
-                year_filtered_df.groupby("season")["production"].sum().reset_index()
-            )
             seasonal_share["share"] = seasonal_share["production"] / total_production * 100
 
+            # Built per interaction, so deliberately not cached
             fig_season_share = px.pie(
                 seasonal_share,
                 values="share",
                 names="season",
-                title=f"🍰 Seasonal Share of Production in {state_option}"
+                title=f"🍰 Seasonal Share of Production in {state}"
             )
             st.plotly_chart(fig_season_share, use_container_width=True)
         else:
@@ -148,12 +226,7 @@ if state_option != "All India":
 
     with col2:
         if not filtered_df_season_year.empty:
-            top_crops = (
-                filtered_df_season_year.groupby("crop")["production"].sum()
-                .reset_index()
-                .sort_values(by="production", ascending=False)
-                .head(5)
-            )
+            top_crops = agg_by(filtered_df_season_year, "crop", "production").nlargest(5, "production")
             fig_top_crops = px.bar(
                 top_crops,
                 x="crop",
@@ -165,126 +238,115 @@ if state_option != "All India":
         else:
             st.warning("No crop data for this season and year range.")
 
-    coconut_df = pd.read_csv("data/coconut_filtered.csv")
 
-    selected_state=state_option
+# ---------------- CACHED FIGURES ----------------
+# Figures are cached by their (small, already aggregated) inputs and shared
+# across sessions, so they must not be mutated after they are returned.
 
-    state_df = coconut_df[coconut_df['state'] == selected_state]
+@st.cache_resource
+def fig_crop_production(state, crop_prod):
+    return px.bar(crop_prod, x="crop", y="production", title=f"🌾 Crop-wise Production in {state}")
 
-    st.header("Coconut Crop Analysis")
-    if state_df.empty:
-        st.warning("⚠️ No data available after filtering.")
-    else:
 
-        prod_trend = state_df.groupby("year")["production"].sum().reset_index()
+@st.cache_resource
+def fig_state_yield_trend(state, yield_trend):
+    return px.line(yield_trend, x="year", y="yield", markers=True,
+                   title=f"📈 Yield Trend in {state}")
 
-        fig1 = px.line(
-            prod_trend,
-            x="year",
-            y="production",
-            title=f"Coconut Production Over Years in {selected_state}"
-        )
-        st.plotly_chart(fig1, use_container_width=True)
-
-        # Area vs Production
-        if "area" in state_df.columns and "production" in state_df.columns:
-            fig2 = px.scatter(state_df, x="area", y="production", size="production", color="year",
-                              title=f"Area vs Production in {selected_state}")
-            st.plotly_chart(fig2, use_container_width=True)
-
-        # Average yield per year
-        if "year" in state_df.columns and "yield" in state_df.columns:
-            avg_yield = state_df.groupby("year")["yield"].mean().reset_index()
-            fig3 = px.line(avg_yield, x="year", y="yield", title=f"Average Yield Over Years in {selected_state}")
-            st.plotly_chart(fig3, use_container_width=True)
 
+@st.cache_resource
+def fig_crop_season_heatmap(state, mat):
+    fig = px.imshow(
+        mat,
+        aspect="auto",
+        labels=dict(color="Production"),
+        title=f"🔥 Crop vs Season Production in {state}",
+        color_continuous_scale="Turbo"
+    )
+    fig.update_layout(
+        width=1000,
+        height=700,
+        xaxis_title="Season",
+        yaxis_title="Crop",
+        title_x=0.3,
+        font=dict(size=14)
+    )
+    return fig
 
-        # Group by district and sum production
-        district_prod = state_df.groupby("district")["production"].sum().reset_index()
 
-        # Sort and take top 10 districts
-        top_districts = district_prod.sort_values(by="production", ascending=False).head(10)
+@st.cache_resource
+def fig_coconut_state_production(state, by_year):
+    return px.line(
+        by_year,
+        x="year",
+        y="production",
+        title=f"Coconut Production Over Years in {state}"
+    )
 
-        # Plotly bar chart
-        fig = px.bar(
-            top_districts,
-            x="district",
-            y="production",
-            color="production",
-            text="production",
-            title=f"Top 10 Districts by Coconut Production in {selected_state}",
-            color_continuous_scale="Blues"
-        )
 
-        fig.update_layout(
-            xaxis_title="District",
-            yaxis_title="Production",
-            xaxis_tickangle=-45
-        )
+@st.cache_resource
+def fig_coconut_state_area_production(state, state_df):
+    return px.scatter(state_df, x="area", y="production", size="production", color="year",
+                      title=f"Area vs Production in {state}")
 
-        st.plotly_chart(fig, use_container_width=True)
 
-# ---------------- NATIONAL VIEW ----------------
-else:
-    st.markdown("""
-        🌾 **Agriculture Data Analysis (India)**  
+@st.cache_resource
+def fig_coconut_state_yield(state, by_year):
+    return px.line(by_year, x="year", y="yield", title=f"Average Yield Over Years in {state}")
 
-        Analyze and visualize India's crop production trends across states, districts, and years.  
-        This project explores agricultural patterns using a cleaned dataset from **Kaggle**  
-        Crop Production Dataset – 1997 to 2020
-        originally sourced from the [Government of India – Directorate of Economics and Statistics](https://data.gov.in)    
 
-        🛠️ **Tech Stack:** Python (Pandas, Plotly, Streamlit)  
-        📊 **Features:** 
-        - Yearly crop yield & production trends  
-        - State-wise & district-wise comparisons  
-        - Seasonal insights across major crops  
-        - Interactive visualizations for exploration  
+@st.cache_resource
+def fig_coconut_top_districts(state, top_districts):
+    fig = px.bar(
+        top_districts,
+        x="district",
+        y="production",
+        color="production",
+        text="production",
+        title=f"Top 10 Districts by Coconut Production in {state}",
+        color_continuous_scale="Blues"
+    )
 
-        """)
-    filtered_df = df
+    fig.update_layout(
+        xaxis_title="District",
+        yaxis_title="Production",
+        xaxis_tickangle=-45
+    )
+    return fig
 
-    show_metrics(filtered_df, title="All India")
 
-    # Crop share pie chart
-    prod_by_crop = filtered_df.groupby("crop", as_index=False)["production"].sum()
+@st.cache_resource
+def fig_crop_share(prod_by_crop):
+    fig = px.pie(
+        prod_by_crop,
+        values="production",
+        names="crop",
+        title="Share of Total Production by Crop",
+        hole=0.3
+    )
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    return fig
 
-    colg1, colg2 = st.columns(2)
-    with colg1:
-        fig = px.pie(
-            prod_by_crop,
-            values="production",
-            names="crop",
-            title="Share of Total Production by Crop",
-            hole=0.3
-        )
-        fig.update_traces(textposition='inside', textinfo='percent+label')
-        st.plotly_chart(fig, use_container_width=True)
 
-    # Top states by yield
-    with colg2:
-        state_yield = (
-            filtered_df.groupby("state", as_index=False)["yield"].mean()
-            .sort_values(by="yield", ascending=False)
-            .head(10)
-        )
-        fig = px.bar(
-            state_yield,
-            x="state",
-            y="yield",
-            title="Top 10 States by Average Yield",
-            labels={"state": "State", "yield": "Average Yield (tons/ha)"},
-            text_auto='.2f'
-        )
-        fig.update_traces(marker_color='green', textposition='outside')
-        fig.update_layout(xaxis_tickangle=-45)
-        st.plotly_chart(fig, use_container_width=True)
+@st.cache_resource
+def fig_top_state_yield(state_yield):
+    fig = px.bar(
+        state_yield,
+        x="state",
+        y="yield",
+        title="Top 10 States by Average Yield",
+        labels={"state": "State", "yield": "Average Yield (tons/ha)"},
+        text_auto='.2f'
+    )
+    fig.update_traces(marker_color='green', textposition='outside')
+    fig.update_layout(xaxis_tickangle=-45)
+    return fig
 
 
-    # National yearly production
-    yearly_production = filtered_df.groupby("year", as_index=False)["production"].sum()
+@st.cache_resource
+def fig_yearly_production(by_year):
     fig = px.line(
-        yearly_production,
+        by_year,
         x="year",
         y="production",
         title="Trend of Total Production Over Years",
@@ -293,53 +355,47 @@ else:
     )
     fig.update_traces(line_color='blue', line_width=3)
     fig.update_layout(xaxis=dict(dtick=1))
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
-    # National yield trend
-    yield_trend = df.groupby("year", as_index=False)["yield"].mean()
-    fig_yield_trend = px.line(
-        yield_trend,
+
+@st.cache_resource
+def fig_yield_trend(by_year):
+    fig = px.line(
+        by_year,
         x="year",
         y="yield",
         markers=True,
         title="📈 Average Yield Trend Over the Years",
         labels={"year": "Year", "yield": "Average Yield (tons/hectare)"},
     )
-    fig_yield_trend.update_traces(line=dict(width=3), marker=dict(size=8))
-    st.plotly_chart(fig_yield_trend, use_container_width=True)
+    fig.update_traces(line=dict(width=3), marker=dict(size=8))
+    return fig
 
 
-    # If data has multiple states, aggregate to All India level
-    india_df = filtered_df.groupby("year")[["area", "production"]].sum().reset_index()
-
-    # Compute yield
-    india_df["yield"] = india_df["production"] / india_df["area"]
-
-    # ---- 1. Year-over-Year % Change in Production ----
-    india_df["prod_pct_change"] = india_df["production"].pct_change() * 100
-
-    fig1 = px.bar(
+@st.cache_resource
+def fig_prod_pct_change(india_df):
+    return px.bar(
         india_df,
         x="year",
         y="prod_pct_change",
         title="Year-over-Year % Change in Agricultural Production (All India)",
         labels={"prod_pct_change": "% Change", "year": "Year"}
     )
-    st.plotly_chart(fig1, use_container_width=True)
 
-    # ---- 2. Correlation Matrix ----
-    corr = filtered_df[["area", "production", "yield"]].corr()
 
-    fig2 = px.imshow(
+@st.cache_resource
+def fig_corr(corr):
+    return px.imshow(
         corr,
         text_auto=True,
         color_continuous_scale="Viridis",
         title="Correlation Matrix: Area, Production, Yield (All India)"
     )
-    st.plotly_chart(fig2, use_container_width=True)
 
-    # ---- 3. Bubble Chart ----
-    fig3 = px.scatter(
+
+@st.cache_resource
+def fig_yield_vs_area(india_df):
+    return px.scatter(
         india_df,
         x="area",
         y="yield",
@@ -349,30 +405,18 @@ else:
         title="Yield vs Area (Bubble Size = Production, All India)",
         labels={"yield": "Yield (Production/Area)", "area": "Area (ha)"}
     )
-    st.plotly_chart(fig3, use_container_width=True)
 
 
-    #coconut crop analysis
-    coconut_df = pd.read_csv("data/coconut_filtered.csv")
-
-    # 1. Production trend over years
-    st.subheader("📈 Coconut Production Trend Over Years")
-    prod_year = coconut_df.groupby("year")["production"].sum().reset_index()
-    fig1 = px.line(prod_year, x="year", y="production", markers=True,
+@st.cache_resource
+def fig_coconut_production(coconut_by_year):
+    return px.line(coconut_by_year, x="year", y="production", markers=True,
                    title="Coconut Production Over the Years (All India)")
-    st.plotly_chart(fig1, use_container_width=True)
 
-    df_long = coconut_df.melt(
-        id_vars="year",
-        value_vars=["area", "production"],
-        var_name="Metric",
-        value_name="Value"
-    )
-
-    agg_df = coconut_df.groupby("year")[["area", "production"]].sum().reset_index()
 
+@st.cache_resource
+def fig_coconut_area_production(coconut_by_year):
     fig = px.line(
-        agg_df,
+        coconut_by_year,
         x="year",
         y=["area", "production"],
         markers=True,
@@ -382,41 +426,224 @@ else:
 
     # Set y-axis to log scale
     fig.update_yaxes(type="log")
+    return fig
+
+
+@st.cache_resource
+def fig_coconut_yield(coconut_by_year):
+    return px.line(coconut_by_year, x="year", y="yield", markers=True,
+                   title="Average Yield of Coconut Over Years")
+
+
+@st.cache_resource
+def fig_coconut_season_share(season_share):
+    return px.pie(season_share, names="season", values="production",
+                  title="Seasonal Share of Coconut Production")
+
+
+@st.cache_resource
+def fig_coconut_top_states(state_prod):
+    return px.bar(state_prod, x="state", y="production", title="Top 10 States in Coconut Production")
+
+
+# Streamlit page config
+st.set_page_config(layout='wide', page_title='Crop Production Dashboard')
+st.markdown("""
+    <style>
+        .block-container {
+            padding-top: 1rem; /* Reduce default padding */
+        }
+    </style>
+""", unsafe_allow_html=True)
+
+# Title
+st.title("📊 Crop Production Statistics in India")
+st.sidebar.title("Customize Your View")
+
+# Load dataset
+df = load_main()
+
+# Sidebar selector
+state_option = st.sidebar.selectbox(
+    "Select Region",
+    options=["All India"] + df["state"].cat.categories.tolist()
+)
+
+# ---------------- STATE LEVEL VIEW ----------------
+if state_option != "All India":
+
+    # Filter for selected state
+    filtered_df = load_main_by_state().loc[[state_option]]
+    show_metrics(filtered_df, title=state_option)
+
+    # The charts below only need the state's slice of the pre-aggregated cube,
+    # which is ordered by year, season, crop
+    state_cube = build_cube(df).loc[state_option].reset_index()
+
+    # ---- Crop-wise Production ----
+    crop_prod = agg_by(state_cube, "crop", "production")
+    st.plotly_chart(fig_crop_production(state_option, crop_prod), use_container_width=True)
+
+    # ---- Yield Trend ----
+    yield_trend = yearly_reduce(state_cube, sums=["yield_sum", "rows"])
+    yield_trend["yield"] = yield_trend["yield_sum"] / yield_trend["rows"]
+    st.plotly_chart(fig_state_yield_trend(state_option, yield_trend), use_container_width=True)
+
+    # ---- Heatmap: Crop vs Season ----
+    mat = pivot_sum(state_cube, "crop", "season", "production")
+    st.plotly_chart(fig_crop_season_heatmap(state_option, mat), use_container_width=True)
+
+    # ---------------- SEASON ANALYSIS ----------------
+    st.subheader("🌾 Season Analysis")
+
+    # Markdown table
+    st.markdown(SEASON_TABLE_MD)
+
+    # Season options in the order they first appear in the state's raw rows
+    seasons = filtered_df["season"].unique()
+    season_panel(state_cube, state_option, seasons, *main_year_range())
+
+    coconut_by_state = load_coconut_by_state()
+
+    selected_state=state_option
+
+    if selected_state in coconut_by_state.index:
+        state_df = coconut_by_state.loc[[selected_state]]
+    else:
+        state_df = coconut_by_state.iloc[:0]
+
+    st.header("Coconut Crop Analysis")
+    if state_df.empty:
+        st.warning("⚠️ No data available after filtering.")
+    else:
+
+        by_year = yearly_reduce(state_df, sums=["production"], means=["yield"])
+
+        st.plotly_chart(fig_coconut_state_production(selected_state, by_year), use_container_width=True)
+
+        # Area vs Production
+        if "area" in state_df.columns and "production" in state_df.columns:
+            st.plotly_chart(fig_coconut_state_area_production(selected_state, state_df),
+                            use_container_width=True)
+
+        # Average yield per year
+        if "year" in state_df.columns and "yield" in state_df.columns:
+            st.plotly_chart(fig_coconut_state_yield(selected_state, by_year), use_container_width=True)
+
+
+        # Sum production per district and take the top 10
+        top_districts = top_by_sum(state_df, "district", "production")
+        st.plotly_chart(fig_coconut_top_districts(selected_state, top_districts), use_container_width=True)
+
+# ---------------- NATIONAL VIEW ----------------
+else:
+    st.markdown("""
+        🌾 **Agriculture Data Analysis (India)**  
+
+        Analyze and visualize India's crop production trends across states, districts, and years.  
+        This project explores agricultural patterns using a cleaned dataset from **Kaggle**  
+        Crop Production Dataset – 1997 to 2020
+        originally sourced from the [Government of India – Directorate of Economics and Statistics](https://data.gov.in)    
+
+        🛠️ **Tech Stack:** Python (Pandas, Plotly, Streamlit)  
+        📊 **Features:** 
+        - Yearly crop yield & production trends  
+        - State-wise & district-wise comparisons  
+        - Seasonal insights across major crops  
+        - Interactive visualizations for exploration  
+
+        """)
+    filtered_df = df
+
+    show_metrics(filtered_df, title="All India")
+
+    # Crop share pie chart
+    prod_by_crop = agg_by(filtered_df, "crop", "production")
+
+    colg1, colg2 = st.columns(2)
+    with colg1:
+        st.plotly_chart(fig_crop_share(prod_by_crop), use_container_width=True)
+
+    # Top states by yield
+    with colg2:
+        state_yield = agg_by(filtered_df, "state", "yield", how="mean").nlargest(10, "yield")
+        st.plotly_chart(fig_top_state_yield(state_yield), use_container_width=True)
 
-    st.plotly_chart(fig, use_container_width=True)
+
+    # Yearly totals and mean yield, reduced over the year-sorted frame
+    by_year = yearly_reduce(load_main_by_year(), sums=["area", "production"], means=["yield"])
+
+    # National yearly production
+    st.plotly_chart(fig_yearly_production(by_year), use_container_width=True)
+
+    # National yield trend
+    st.plotly_chart(fig_yield_trend(by_year), use_container_width=True)
+
+
+    # If data has multiple states, aggregate to All India level
+    india_df = india_yearly(by_year)
+
+    # ---- 1. Year-over-Year % Change in Production ----
+    st.plotly_chart(fig_prod_pct_change(india_df), use_container_width=True)
+
+    # ---- 2. Correlation Matrix ----
+    corr = corr_of(filtered_df, ["area", "production", "yield"])
+
+    st.plotly_chart(fig_corr(corr), use_container_width=True)
+
+    # ---- 3. Bubble Chart ----
+    st.plotly_chart(fig_yield_vs_area(india_df), use_container_width=True)
+
+
+    #coconut crop analysis
+    coconut_df = load_coconut()
+
+    coconut_by_year = agg_stats(coconut_df, "year", {
+        "area": ("area", "sum"),
+        "production": ("production", "sum"),
+        "yield": ("yield", "mean"),
+    })
+
+    # 1. Production trend over years
+    st.subheader("📈 Coconut Production Trend Over Years")
+    st.plotly_chart(fig_coconut_production(coconut_by_year), use_container_width=True)
+
+    df_long = coconut_df.melt(
+        id_vars="year",
+        value_vars=["area", "production"],
+        var_name="Metric",
+        value_name="Value"
+    )
+
+    st.plotly_chart(fig_coconut_area_production(coconut_by_year), use_container_width=True)
 
     # 3. Yield trend
     st.subheader("📉 Yield Trend (Production / Area)")
-    coconut_df["yield"] = coconut_df["production"] / coconut_df["area"]
-
-    yield_year = coconut_df.groupby("year")["yield"].mean().reset_index()
-    fig3 = px.line(yield_year, x="year", y="yield", markers=True,
-                   title="Average Yield of Coconut Over Years")
-    st.plotly_chart(fig3, use_container_width=True)
+    st.plotly_chart(fig_coconut_yield(coconut_by_year), use_container_width=True)
 
     # 4. Season-wise share of production
     st.subheader("🗓️ Season-wise Share of Production")
-    season_share = coconut_df.groupby("season")["production"].sum().reset_index()
-    fig4 = px.pie(season_share, names="season", values="production",
-                  title="Seasonal Share of Coconut Production")
-    st.plotly_chart(fig4, use_container_width=True)
+    season_share = agg_by(coconut_df, "season", "production")
+    st.plotly_chart(fig_coconut_season_share(season_share), use_container_width=True)
 
     # 5. Top states in coconut production
     st.subheader("🏆 Top States in Coconut Production")
-    state_prod = coconut_df.groupby("state")["production"].sum().reset_index().sort_values(by="production",
-                                                                                           ascending=False).head(10)
-    fig5 = px.bar(state_prod, x="state", y="production", title="Top 10 States in Coconut Production")
-    st.plotly_chart(fig5, use_container_width=True)
+    state_prod = agg_by(coconut_df, "state", "production").nlargest(10, "production")
+    st.plotly_chart(fig_coconut_top_states(state_prod), use_container_width=True)
 
     # 6. Year & State filter for deeper analysis
     st.subheader("🔍 Filtered Analysis")
-    year_filter = st.selectbox("Select Year", sorted(coconut_df["year"].unique()))
-    state_filter = st.selectbox("Select State", sorted(coconut_df["state"].unique()))
-
-    filtered_df = coconut_df[(coconut_df["year"] == year_filter) & (coconut_df["state"] == state_filter)]
+    year_filter = st.selectbox("Select Year", coconut_years())
+    state_filter = st.selectbox("Select State", coconut_df["state"].cat.categories.tolist())
+
+    coconut_by_sy = load_coconut_by_state_year()
+    try:
+        filtered_df = coconut_by_sy.loc[[(state_filter, year_filter)]]
+    except KeyError:
+        filtered_df = coconut_by_sy.iloc[:0]
     if not filtered_df.empty:
         st.write(f"Data for **{state_filter}** in **{year_filter}**")
-        st.dataframe(filtered_df)
+        st.dataframe(filtered_df.reset_index(drop=True))
     else:
         st.warning("No data available for this selection.")
 